@@ -19,10 +19,15 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 from . import models
-from .datastore import (
-    DataStore,
-    DataStoreNotInitializedError,
-    DataStoreSession,
-    DevDataStore,
-    workflow_db,
-)
+from .datastore import DataStore, DataStoreNotInitializedError, DataStoreSession, DevDataStore
+
+
+def __getattr__(name: str):
+    # Defer constructing the module-level DataStore singleton until it is
+    # actually used (PEP 562).
+    if name == "workflow_db":
+        from .datastore import workflow_db
+
+        return workflow_db
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,29 +18,46 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+from collections import defaultdict
 from contextlib import contextmanager
-from os import path
+from os import environ, path
 from pathlib import Path
-from typing import BinaryIO, Dict, Generator, List, Optional, Union
+from typing import BinaryIO, Dict, Generator, List, Optional, Tuple, Union
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from alembic import command
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
 
 from .._shared_files.config import get_config
 from . import models
 from .storage_backends import LocalStorageBackend, StorageBackend
 
-default_backend_map = {"local": LocalStorageBackend(base_dir=get_config("workflow_data.base_dir"))}
+_default_backend_map = None
+
+
+def _get_default_backend_map() -> Dict[str, "StorageBackend"]:
+    """Construct the default storage backend map on first use."""
+
+    global _default_backend_map
+    if _default_backend_map is None:
+        _default_backend_map = {
+            "local": LocalStorageBackend(base_dir=get_config("workflow_data.base_dir"))
+        }
+    return _default_backend_map
 
 
 class DataStore:
+
+    _ALEMBIC_INI = Path(path.join(__file__, "./../../../alembic.ini")).resolve()
+
     def __init__(
         self,
         db_URL: Optional[str] = None,
-        storage_backend_map: Dict[str, StorageBackend] = default_backend_map,
+        storage_backend_map: Optional[Dict[str, StorageBackend]] = None,
         initialize_db: bool = False,
         **kwargs,
     ):
@@ -49,34 +66,118 @@ class DataStore:
         else:
             self.db_URL = "sqlite+pysqlite:///" + get_config("user_interface.dispatch_db")
 
+        if storage_backend_map is None:
+            storage_backend_map = _get_default_backend_map()
         self.storage_backend_map = storage_backend_map
+
+        # SQLAlchemy's SQLite defaults (SingletonThreadPool / NullPool) either
+        # serialize concurrent callers or re-open the database file per
+        # session. Pool connections explicitly instead; caller kwargs win.
+        if self.db_URL.startswith("sqlite"):
+            if ":memory:" in self.db_URL:
+                kwargs.setdefault("poolclass", StaticPool)
+                kwargs.setdefault("connect_args", {"check_same_thread": False})
+            else:
+                kwargs.setdefault("poolclass", QueuePool)
+                kwargs.setdefault("pool_size", 5)
+                kwargs.setdefault("max_overflow", 10)
+                kwargs.setdefault("connect_args", {"check_same_thread": False, "timeout": 30})
+
         self.engine = create_engine(self.db_URL, **kwargs)
+
+        # WAL lets concurrent readers proceed while a writer commits and
+        # reduces the number of fsyncs per commit. Skip in-memory databases,
+        # which don't support WAL and are only used in tests.
+        if self.db_URL.startswith("sqlite") and ":memory:" not in self.db_URL:
+            event.listen(self.engine, "connect", self._set_sqlite_pragmas)
+
         self.Session = sessionmaker(self.engine)
+        self._alembic_config = None
 
         # flag should only be used in pytest - tables should be generated using migrations
         if initialize_db:
             models.Base.metadata.create_all(self.engine)
 
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune each raw SQLite connection for concurrent access."""
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=30000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+    def get_alembic_config(self) -> Config:
+        """Return the alembic Config, building and caching it on first use."""
+
+        if self._alembic_config is None:
+            alembic_config = Config(self._ALEMBIC_INI)
+            alembic_config.attributes["configure_logger"] = False
+            alembic_config.set_main_option("sqlalchemy.url", self.db_URL)
+            self._alembic_config = alembic_config
+        return self._alembic_config
+
     def run_migrations(self):
+        command.upgrade(self.get_alembic_config(), "head")
+
+    def current_revision(self) -> Optional[str]:
+        """Return the alembic revision the database is currently at."""
 
-        alembic_ini_path = Path(path.join(__file__, "./../../../alembic.ini")).resolve()
-        alembic_config = Config(alembic_ini_path)
-        alembic_config.attributes["configure_logger"] = False
-        alembic_config.set_main_option("sqlalchemy.url", self.db_URL)
-        command.upgrade(alembic_config, "head")
+        # Scope the connection so repeated revision probes reuse the pool
+        # instead of leaking a new connection (and its connect-time PRAGMAs)
+        # per call.
+        with self.engine.connect() as conn:
+            context = MigrationContext.configure(conn)
+            return context.get_current_revision()
 
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
         with self.Session.begin() as session:
             yield session
 
+    @contextmanager
+    def begin_session(
+        self, metadata: Optional[dict] = None
+    ) -> Generator["DataStoreSession", None, None]:
+        with self.Session.begin() as session:
+            ds_session = DataStoreSession(session, metadata)
+            yield ds_session
+
+        # Flush queued file operations after the DB transaction commits,
+        # one batch per storage backend rather than one call per file.
+        for storage_type, items in ds_session.pending_uploads.items():
+            self.upload_files(storage_type, items)
+        for storage_type, items in ds_session.pending_deletes.items():
+            self.delete_files(storage_type, items)
+
+    def upload_files(self, storage_type: str, items: List[Tuple[BinaryIO, str, str]]):
+        """Upload a batch of (data, storage_path, file_name) items to one backend."""
+
+        backend = self.storage_backend_map[storage_type]
+        for data, storage_path, file_name in items:
+            backend.put(data, storage_path, file_name, -1, overwrite=True)
+
+    def delete_files(self, storage_type: str, items: List[Tuple[str, str]]):
+        """Delete a batch of (storage_path, file_name) items from one backend."""
+
+        backend = self.storage_backend_map[storage_type]
+        objects_by_path = defaultdict(list)
+        for storage_path, file_name in items:
+            objects_by_path[storage_path].append(file_name)
+        for storage_path, object_names in objects_by_path.items():
+            backend.delete(storage_path, object_names)
+
 
 class DevDataStore(DataStore):
     def __init__(
         self,
         db_URL: Optional[str] = None,
         initialize_db: bool = False,
-        storage_backend_map: Dict[str, StorageBackend] = default_backend_map,
+        storage_backend_map: Optional[Dict[str, StorageBackend]] = None,
         **kwargs,
     ):
         if not db_URL:
@@ -87,17 +188,17 @@ class DevDataStore(DataStore):
 
 
 class DataStoreSession:
-    def __init__(self, session: Session, metadata={}):
+    def __init__(self, session: Session, metadata: Optional[dict] = None):
         self.db_session = session
-        self.metadata = metadata
-        self.pending_uploads = []
-        self.pending_deletes = []
+        self.metadata = metadata if metadata is not None else {}
+        self.pending_uploads = defaultdict(list)
+        self.pending_deletes = defaultdict(list)
 
     def queue_upload(self, data: BinaryIO, storage_type: str, storage_path: str, file_name: str):
-        self.pending_uploads.append((data, storage_type, storage_path, file_name))
+        self.pending_uploads[storage_type].append((data, storage_path, file_name))
 
     def queue_delete(self, storage_type: str, storage_path: str, file_name: str):
-        self.pending_deletes.append((storage_type, storage_path, file_name))
+        self.pending_deletes[storage_type].append((storage_path, file_name))
 
 
 class DataStoreNotInitializedError(Exception):
@@ -108,7 +209,22 @@ class DataStoreNotInitializedError(Exception):
         super().__init__(self.message)
 
 
-# we can switch this to any class instance that has a db_URL property that points to the db
-# which we want to run migrations against - this command also creates the db without tables
-# via create_engine()
-workflow_db = DataStore(echo=True)
+_workflow_db = None
+
+
+def __getattr__(name: str):
+    """Construct the module-level singletons lazily on first access (PEP 562)."""
+
+    # we can switch this to any class instance that has a db_URL property that points to the db
+    # which we want to run migrations against - this command also creates the db without tables
+    # via create_engine()
+    if name == "workflow_db":
+        global _workflow_db
+        if _workflow_db is None:
+            _workflow_db = DataStore(echo=environ.get("COVALENT_SQL_ECHO") == "1")
+        return _workflow_db
+
+    if name == "default_backend_map":
+        return _get_default_backend_map()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
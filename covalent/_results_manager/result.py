@@ -356,12 +356,16 @@ Node Outputs
                 .where(models.Electron.parent_lattice_id == lattice_id)
                 .all()
             )
+            # The electron rows already carry the name and the result file
+            # location, so build the dict from this one query instead of
+            # re-querying per node via _get_node_name/_get_node_output.
             all_node_outputs = {}
             for electron in electron_records:
                 node_id = electron.transport_graph_node_id
-                all_node_outputs[
-                    f"{self._get_node_name(db, node_id)}({node_id})"
-                ] = self._get_node_output(db, node_id)
+                with open(
+                    os.path.join(electron.storage_path, electron.results_filename), "rb"
+                ) as f:
+                    all_node_outputs[f"{electron.name}({node_id})"] = pickle.load(f)
             return all_node_outputs
 
     def get_all_node_results(self, db: DataStore) -> List[Dict]:
@@ -19,13 +19,99 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 
-from dataclasses import dataclass
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
 from typing import NamedTuple
 
+import orjson
+
+from .config import get_config
+from .logger import app_log
+
+_report_dir_initialized = False
+
+_timer_queue = queue.Queue()
+_timer_writer_started = False
+_timer_writer_lock = threading.Lock()
+
+
+def _timer_writer() -> None:
+    """Drain the timer queue, opening the report file once per batch."""
+
+    while True:
+        batch = [_timer_queue.get()]
+        while True:
+            try:
+                batch.append(_timer_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        records_by_location = {}
+        for location, record in batch:
+            records_by_location.setdefault(location, []).append(record)
+
+        try:
+            for location, records in records_by_location.items():
+                try:
+                    with open(location, "ab") as report_file:
+                        report_file.write(b"".join(orjson.dumps(r) + b"\n" for r in records))
+                except Exception:
+                    # A failed write (report dir removed, permissions, full
+                    # disk) must not kill the queue's only consumer: nothing
+                    # would restart it, later records would never be written,
+                    # and the atexit flush would block shutdown forever on
+                    # join(). Drop the batch for this file and keep draining.
+                    app_log.exception("Failed to write timer report to %s", location)
+        finally:
+            for _ in batch:
+                _timer_queue.task_done()
+
+
+def _flush_timer_queue() -> None:
+    """Block until every queued timer record has been written to disk."""
+
+    _timer_queue.join()
+
+
+def _ensure_timer_writer() -> None:
+    global _timer_writer_started
+    if not _timer_writer_started:
+        with _timer_writer_lock:
+            if not _timer_writer_started:
+                threading.Thread(target=_timer_writer, daemon=True).start()
+                atexit.register(_flush_timer_queue)
+                _timer_writer_started = True
+
 
-@dataclass
 class Status:
-    STATUS: str
+    """
+    Status of a dispatch or node.
+
+    A thin wrapper around an interned status string: equality, hashing and
+    str() delegate to the stored string, so hot-path comparisons are plain
+    string operations (and also work against raw strings, e.g. values read
+    back from the database). The pickle layout matches the dataclass this
+    replaces — plain ``{"STATUS": ...}`` state — so results directories
+    written by older releases still load.
+    """
+
+    def __init__(self, status: str):
+        self.STATUS = sys.intern(status)
+
+    def __eq__(self, other):
+        if isinstance(other, Status):
+            return self.STATUS == other.STATUS
+        if isinstance(other, str):
+            return self.STATUS == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.STATUS)
 
     def __bool__(self):
         """
@@ -49,6 +135,107 @@ class RESULT_STATUS:
     CANCELLED = Status("CANCELLED")
 
 
+class Timer:
+    """
+    Timer to benchmark the different covalent services.
+
+    Measures the wall-clock time between `start` and `stop` calls and
+    appends one JSON record per measurement to a JSONL report file, so
+    each stop is a single O(1) append instead of rewriting the whole
+    report. Writes happen on a background thread, batched per file
+    open. Use `load_timer_report` to reconstruct the nested report.
+
+    Attributes:
+        endpoint: Endpoint or function being timed.
+        descriptor: Short description of the operation being timed.
+        service: Covalent service the operation belongs to.
+        dispatch_id: Dispatch id of the workflow being timed, if any.
+    """
+
+    DATA_STORE = "data_store"
+    DISPATCHER = "dispatcher"
+    RESULTS = "results"
+    UI = "ui"
+
+    def __init__(
+        self, endpoint: str, descriptor: str, service: str, dispatch_id: str = None
+    ) -> None:
+        self.endpoint = endpoint
+        self.descriptor = descriptor
+        self.service = service
+        self.dispatch_id = dispatch_id
+        self.json_file_location = Path(get_config("dispatcher.log_dir")) / "timer_report.jsonl"
+
+    def start(self) -> None:
+        # perf_counter_ns stays in integer arithmetic; floats only appear
+        # when a record is serialized or displayed.
+        self._start_ns = time.perf_counter_ns()
+        # %s-style args are only formatted if the DEBUG level is enabled
+        app_log.debug(
+            "Started timing %s at %s in %s", self.descriptor, self.endpoint, self.service
+        )
+
+    def stop(self) -> None:
+        self.elapsed_ns = time.perf_counter_ns() - self._start_ns
+        app_log.debug(
+            "Stopped timing %s at %s in %s, took %s seconds",
+            self.descriptor,
+            self.endpoint,
+            self.service,
+            self.elapsed_ns / 1e9,
+        )
+        self.write_to_file()
+
+    def write_to_file(self) -> None:
+        """Append the last measurement as one line of the JSONL report file."""
+
+        global _report_dir_initialized
+        if not _report_dir_initialized:
+            self.json_file_location.parent.mkdir(parents=True, exist_ok=True)
+            _report_dir_initialized = True
+
+        record = {
+            "dispatch_id": self.dispatch_id,
+            "timestamp": time.time(),
+            "endpoint": self.endpoint,
+            "descriptor": self.descriptor,
+            "service": self.service,
+            "elapsed_time": self.elapsed_ns / 1e9,
+        }
+        # Hand the record to the background writer so the caller does not
+        # pay the disk-write latency inline.
+        _ensure_timer_writer()
+        _timer_queue.put((self.json_file_location, record))
+
+
+def load_timer_report(json_file_location: str = None) -> dict:
+    """
+    Reconstruct the nested timing report from the JSONL report file.
+
+    Args:
+        json_file_location: Path to the report file. Defaults to the
+            report file written by `Timer.write_to_file`.
+
+    Returns:
+        Report of the form {dispatch_id: {"ts__endpoint__descriptor": record}}.
+    """
+
+    if json_file_location is None:
+        json_file_location = os.path.join(get_config("dispatcher.log_dir"), "timer_report.jsonl")
+
+    report = {}
+    if not os.path.exists(json_file_location):
+        return report
+
+    with open(json_file_location, "rb") as report_file:
+        for line in report_file:
+            record = orjson.loads(line)
+            key = f"{record['timestamp']}__{record['endpoint']}__{record['descriptor']}"
+            report.setdefault(record["dispatch_id"], {})[key] = record
+
+    return report
+
+
 class DispatchInfo(NamedTuple):
     """
     Information about a dispatch to be shared to a task post dispatch.
@@ -22,6 +22,7 @@
 
 import base64
 import json
+import pickle
 import platform
 from copy import deepcopy
 from typing import Any, Callable, Dict, List
@@ -33,6 +34,24 @@ from .._data_store import DataStoreSession, models
 from .._shared_files.defaults import parameter_prefix
 
 
+def _pickle_obj(obj: Any) -> bytes:
+    """Pickle an object, preferring stdlib pickle for binary payloads.
+
+    Large binary payloads (bytes and numpy-style buffers) round-trip much
+    faster through the C implementation of stdlib pickle protocol 5 than
+    through cloudpickle's Python-level pickler. Everything else - notably
+    user functions, which must be serialized by value - still goes through
+    cloudpickle. Both produce streams that `cloudpickle.loads` accepts.
+    """
+
+    if isinstance(obj, (bytes, bytearray, memoryview)) or type(obj).__module__ == "numpy":
+        try:
+            return pickle.dumps(obj, protocol=5)
+        except pickle.PicklingError:
+            pass
+    return cloudpickle.dumps(obj)
+
+
 class TransportableObject:
     """
     A function is converted to a transportable object by serializing it using cloudpickle
@@ -45,7 +64,7 @@ class TransportableObject:
     """
 
     def __init__(self, obj: Any) -> None:
-        self._object = base64.b64encode(cloudpickle.dumps(obj)).decode("utf-8")
+        self._object = base64.b64encode(_pickle_obj(obj)).decode("utf-8")
         self.python_version = platform.python_version()
 
         self.object_string = str(obj)
@@ -61,12 +80,23 @@ class TransportableObject:
     def __eq__(self, obj) -> bool:
         if not isinstance(obj, TransportableObject):
             return False
-        return self.__dict__ == obj.__dict__
+        return self.__getstate__() == obj.__getstate__()
+
+    def __getstate__(self) -> dict:
+        # The deserialized cache is derived state; dropping it keeps pickles,
+        # dict representations, and equality checks identical to an instance
+        # that has never been deserialized.
+        state = self.__dict__.copy()
+        state.pop("_deserialized_obj", None)
+        return state
 
     def get_deserialized(self) -> Callable:
         """
         Get the deserialized transportable object.
 
+        The result is cached on the instance, so an object consumed by
+        several nodes is only unpickled once per process.
+
         Args:
             None
 
@@ -75,7 +105,13 @@ class TransportableObject:
 
         """
 
-        return cloudpickle.loads(base64.b64decode(self._object.encode("utf-8")))
+        try:
+            return self._deserialized_obj
+        except AttributeError:
+            self._deserialized_obj = cloudpickle.loads(
+                base64.b64decode(self._object.encode("utf-8"))
+            )
+            return self._deserialized_obj
 
     @property
     def json(self):
@@ -83,7 +119,7 @@ class TransportableObject:
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary representation of self"""
-        return {"type": "TransportableObject", "attributes": self.__dict__.copy()}
+        return {"type": "TransportableObject", "attributes": self.__getstate__()}
 
     @staticmethod
     def from_dict(object_dict) -> "TransportableObject":
@@ -373,12 +409,21 @@ class _TransportGraph:
                           grouped together.
         """
 
-        _g = self._graph.copy()
+        # Kahn's algorithm over an in-degree counter. The previous version
+        # copied the whole graph and rescanned every remaining node per
+        # level, which is quadratic on deep (e.g. linear) graphs.
+        in_degree = dict(self._graph.in_degree())
+        level = [node for node, degree in in_degree.items() if degree == 0]
         res = []
-        while _g:
-            zero_indegree = [v for v, d in _g.in_degree() if d == 0]
-            res.append(zero_indegree)
-            _g.remove_nodes_from(zero_indegree)
+        while level:
+            res.append(level)
+            next_level = []
+            for node in level:
+                for _, child in self._graph.out_edges(node):
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        next_level.append(child)
+            level = next_level
         return res
 
     def get_node_value(self, node_key: int, value_key: str) -> Any:
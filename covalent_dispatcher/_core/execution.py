@@ -27,9 +27,9 @@ import json
 import traceback
 from asyncio import Queue
 from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime, timezone
 from functools import partial
-from threading import Lock
 from typing import Any, Dict, List, Tuple
 
 import uvloop
@@ -69,6 +69,21 @@ from ..entry_point import futures
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
+# Shared DataStore handles per database path. Building a DataStore sets up
+# an engine and connection pool, so rebuilding one per write is wasted work.
+_data_stores: Dict[str, "DataStore"] = {}
+
+
+def _get_shared_data_store():
+    """Return the pooled DataStore for the configured dispatch database."""
+
+    dispatch_db = DispatchDB()
+    store = _data_stores.get(dispatch_db._dbpath)
+    if store is None:
+        store = dispatch_db._get_data_store()
+        _data_stores[dispatch_db._dbpath] = store
+    return store
+
 
 # This is to be run out-of-process
 def _dispatch(fn, *args, **kwargs):
@@ -100,7 +115,14 @@ def generate_node_result(
     }
 
 
-def _get_task_inputs(node_id: int, node_name: str, result_object: Result) -> dict:
+def _get_task_inputs(
+    node_id: int,
+    node_name: str,
+    result_object: Result,
+    parents_of: Dict[int, List[int]] = None,
+    edge_cache: Dict[Tuple[int, int], Any] = None,
+    input_plan: Dict[int, Tuple[List, List]] = None,
+) -> dict:
     """
     Return the required inputs for a task execution.
     This makes sure that any node with child nodes isn't executed twice and fetches the
@@ -111,37 +133,56 @@ def _get_task_inputs(node_id: int, node_name: str, result_object: Result) -> dic
         node_name: Name of the node.
         result_object: Result object to be used to update and store execution related
                        info including the results.
+        parents_of: Optional precomputed map of node id to its parent node ids,
+                    used instead of querying the transport graph per node.
+        edge_cache: Optional precomputed map of (parent, child) to edge data.
+        input_plan: Optional precomputed map of node id to its
+                    (arg_parents, kwarg_parents) input sources, letting the
+                    common branch skip edge-data iteration entirely.
 
     Returns:
         inputs: Input dictionary to be passed to the task containing args, kwargs,
                 and any parent node execution results if present.
     """
 
+    tg = result_object.lattice.transport_graph
+    parents = parents_of[node_id] if parents_of is not None else tg.get_dependencies(node_id)
+
+    def _edge_data(parent: int) -> dict:
+        if edge_cache is not None:
+            return edge_cache[(parent, node_id)]
+        return tg.get_edge_data(parent, node_id)
+
     if node_name.startswith(electron_list_prefix):
-        values = [
-            result_object.lattice.transport_graph.get_node_value(parent, "output")
-            for parent in result_object.lattice.transport_graph.get_dependencies(node_id)
-        ]
+        values = [tg.get_node_value(parent, "output") for parent in parents]
         task_input = {"args": [], "kwargs": {"x": TransportableObject.make_transportable(values)}}
     elif node_name.startswith(electron_dict_prefix):
         values = {}
-        for parent in result_object.lattice.transport_graph.get_dependencies(node_id):
+        for parent in parents:
 
-            edge_data = result_object.lattice.transport_graph.get_edge_data(parent, node_id)
+            edge_data = _edge_data(parent)
 
-            value = result_object.lattice.transport_graph.get_node_value(parent, "output")
+            value = tg.get_node_value(parent, "output")
             for e_key, d in edge_data.items():
                 key = d["edge_name"]
                 values[key] = value
 
         task_input = {"args": [], "kwargs": {"x": TransportableObject.make_transportable(values)}}
+    elif input_plan is not None:
+        arg_parents, kwarg_parents = input_plan[node_id]
+        task_input = {
+            "args": [tg.get_node_value(parent, "output") for parent in arg_parents],
+            "kwargs": {
+                key: tg.get_node_value(parent, "output") for key, parent in kwarg_parents
+            },
+        }
     else:
         task_input = {"args": [], "kwargs": {}}
 
-        for parent in result_object.lattice.transport_graph.get_dependencies(node_id):
+        for parent in parents:
 
-            edge_data = result_object.lattice.transport_graph.get_edge_data(parent, node_id)
-            value = result_object.lattice.transport_graph.get_node_value(parent, "output")
+            edge_data = _edge_data(parent)
+            value = tg.get_node_value(parent, "output")
 
             for e_key, d in edge_data.items():
                 if not d.get("wait_for"):
@@ -217,6 +258,16 @@ async def _dispatch_sublattice(
         app_log.debug(f"Exception when trying to determine sublattice executor: {ex}")
         raise ex
 
+    # The local workflow executor would run _dispatch in this process anyway,
+    # so skip the executor round-trip (a thread hop plus a cloudpickle of
+    # _dispatch itself) and dispatch directly. Out-of-process executors keep
+    # the submission path so the sublattice is still deserialized externally.
+    if short_name == "local":
+        fn = serialized_callable.get_deserialized()
+        args = [arg.get_deserialized() for arg in inputs["args"]]
+        kwargs = {k: v.get_deserialized() for k, v in inputs["kwargs"].items()}
+        return _dispatch(fn, *args, **kwargs)
+
     sub_dispatch_inputs = {"args": [serialized_callable], "kwargs": inputs["kwargs"]}
     for arg in inputs["args"]:
         sub_dispatch_inputs["args"].append(arg)
@@ -241,7 +292,34 @@ async def _dispatch_sublattice(
     )
 
     res = await fut
-    return json.loads(res["output"].json)
+    # The output wraps the dispatch id string returned by _dispatch, so its
+    # string form is the id itself; no need to parse the JSON encoding (and
+    # deserializing the payload here is off-limits by design).
+    return res["output"].object_string
+
+
+def _get_task_executor(short_name: str, object_dict: dict, templates: dict = None) -> Any:
+    """Instantiate the executor for a task, caching one template per config.
+
+    `templates` memoizes one template per unique (plugin, config) pair and
+    is scoped by the caller to a single workflow run: get_executor re-reads
+    the config file on every call precisely so config edits are picked up,
+    and a longer-lived cache would pin the first read for every later
+    dispatch. Each task gets a copy of the template so per-task attribute
+    mutations during execute() don't leak between nodes. The cache is only
+    touched from the scheduler's event loop, so no locking is needed.
+    """
+
+    if templates is None:
+        templates = {}
+    key = (short_name, json.dumps(object_dict, sort_keys=True, default=str))
+    try:
+        template = templates[key]
+    except KeyError:
+        template = _executor_manager.get_executor(short_name)
+        template.from_dict(object_dict)
+        templates[key] = template
+    return deepcopy(template)
 
 
 async def _run_task(
@@ -256,6 +334,7 @@ async def _run_task(
     node_name: str,
     tasks_pool: ThreadPoolExecutor,
     workflow_executor: Any,
+    executor_templates: dict = None,
 ) -> None:
     """
     Run a task with given inputs on the selected executor.
@@ -278,11 +357,10 @@ async def _run_task(
     try:
         short_name, object_dict = selected_executor
 
-        app_log.debug(f"Running task {node_name} using executor {short_name}, {object_dict}")
+        app_log.debug("Running task %s using executor %s, %s", node_name, short_name, object_dict)
 
         # the executor is determined during scheduling and provided in the execution metadata
-        executor = _executor_manager.get_executor(short_name)
-        executor.from_dict(object_dict)
+        executor = _get_task_executor(short_name, object_dict, executor_templates)
     except Exception as ex:
         app_log.debug(f"Exception when trying to determine executor: {ex}")
         raise ex
@@ -302,13 +380,12 @@ async def _run_task(
 
             app_log.debug(f"Sublattice dispatch id: {sub_dispatch_id}")
 
-            with DispatchDB() as db:
-                write_sublattice_electron_id(
-                    db=db._get_data_store(),
-                    parent_dispatch_id=dispatch_id,
-                    sublattice_node_id=node_id,
-                    sublattice_dispatch_id=sub_dispatch_id,
-                )
+            write_sublattice_electron_id(
+                db=_get_shared_data_store(),
+                parent_dispatch_id=dispatch_id,
+                sublattice_node_id=node_id,
+                sublattice_dispatch_id=sub_dispatch_id,
+            )
             # Read the result object directly from the server
 
             sublattice_result = futures[sub_dispatch_id].result()
@@ -332,10 +409,10 @@ async def _run_task(
                 node_result["status"] = Result.FAILED
                 node_result["error"] = "Sublattice workflow failed to complete"
 
-                sublattice_result.upsert_lattice_data(DispatchDB()._get_data_store())
+                sublattice_result.upsert_lattice_data(_get_shared_data_store())
 
         else:
-            app_log.debug(f"Executing task {node_name}")
+            app_log.debug("Executing task %s", node_name)
 
             assembled_callable = partial(wrapper_fn, serialized_callable, call_before, call_after)
 
@@ -383,43 +460,51 @@ async def _run_task(
     return node_result
 
 
+# Nodes frequently share identical dep JSON (e.g. deps set lattice-wide),
+# so rehydrated deps are cached per (class, JSON) instead of rebuilt per node.
+_dep_cache: Dict[str, Any] = {}
+
+
+def _rehydrate_dep(dep_class: type, dep_json: dict) -> Any:
+    """Rehydrate a dep from its JSON dict and apply it, caching the result."""
+
+    key = json.dumps((dep_class.__name__, dep_json), sort_keys=True)
+    try:
+        return _dep_cache[key]
+    except KeyError:
+        dep = dep_class()
+        dep.from_dict(dep_json)
+        applied = dep.apply()
+        _dep_cache[key] = applied
+        return applied
+
+
 def _gather_deps(result_object: Result, node_id: int) -> Tuple[List, List]:
     """Assemble deps for a node into the final call_before and call_after"""
 
-    deps = result_object.lattice.transport_graph.get_node_value(node_id, "metadata")["deps"]
+    node_metadata = result_object.lattice.transport_graph.get_node_value(node_id, "metadata")
 
     # Assemble call_before and call_after from all the deps
 
-    call_before_objs_json = result_object.lattice.transport_graph.get_node_value(
-        node_id, "metadata"
-    )["call_before"]
-    call_after_objs_json = result_object.lattice.transport_graph.get_node_value(
-        node_id, "metadata"
-    )["call_after"]
+    deps = node_metadata["deps"]
+    call_before_objs_json = node_metadata["call_before"]
+    call_after_objs_json = node_metadata["call_after"]
 
     call_before = []
     call_after = []
 
     # Rehydrate deps from JSON
     if "bash" in deps:
-        dep = DepsBash()
-        dep.from_dict(deps["bash"])
-        call_before.append(dep.apply())
+        call_before.append(_rehydrate_dep(DepsBash, deps["bash"]))
 
     if "pip" in deps:
-        dep = DepsPip()
-        dep.from_dict(deps["pip"])
-        call_before.append(dep.apply())
+        call_before.append(_rehydrate_dep(DepsPip, deps["pip"]))
 
     for dep_json in call_before_objs_json:
-        dep = DepsCall()
-        dep.from_dict(dep_json)
-        call_before.append(dep.apply())
+        call_before.append(_rehydrate_dep(DepsCall, dep_json))
 
     for dep_json in call_after_objs_json:
-        dep = DepsCall()
-        dep.from_dict(dep_json)
-        call_after.append(dep.apply())
+        call_after.append(_rehydrate_dep(DepsCall, dep_json))
 
     return call_before, call_after
 
@@ -431,36 +516,46 @@ async def _handle_completed_node(result_object, node_result, pending_deps, tasks
         for edge in edges:
             pending_deps[child] -= 1
         if pending_deps[child] < 1:
-            app_log.debug(f"Queuing node {child} for execution")
+            app_log.debug("Queuing node %s for execution", child)
             await tasks_queue.put(child)
 
 
-async def _handle_failed_node(result_object, node_result, pending_deps, tasks_queue):
+async def _handle_failed_node(db, result_object, node_result, pending_deps, tasks_queue):
     node_id = node_result["node_id"]
     result_object._status = Result.FAILED
     result_object._end_time = datetime.now(timezone.utc)
-    db = DispatchDB()._get_data_store()
     result_object._error = f"Node {result_object._get_node_name(db, node_id)} failed: \n{result_object._get_node_error(db, node_id)}"
     app_log.warning("8A: Failed node upsert statement (run_planned_workflow)")
-    result_object.upsert_lattice_data(DispatchDB()._get_data_store())
+    result_object.upsert_lattice_data(db)
     result_webhook.send_update(result_object)
     await tasks_queue.put(-1)
 
 
-async def _handle_cancelled_node(result_object, node_result, pending_deps, tasks_queue):
+async def _handle_cancelled_node(db, result_object, node_result, pending_deps, tasks_queue):
     result_object._status = Result.CANCELLED
     result_object._end_time = datetime.now(timezone.utc)
     app_log.warning("9: Failed node upsert statement (run_planned_workflow)")
-    result_object.upsert_lattice_data(DispatchDB()._get_data_store())
+    result_object.upsert_lattice_data(db)
     result_webhook.send_update(result_object)
     await tasks_queue.put(-1)
 
 
-async def _update_node_result(lock, result_object, node_result, pending_deps, tasks_queue):
-    with lock:
+# Dedicated worker for the blocking per-node persistence and webhook I/O,
+# so the event loop awaits those writes instead of stalling on them.
+_node_writer_pool = ThreadPoolExecutor(max_workers=1)
+
+
+async def _update_node_result(db, lock, result_object, node_result, pending_deps, tasks_queue):
+    # An asyncio lock keeps result updates serialized without blocking the
+    # event loop the way a thread lock would.
+    async with lock:
         app_log.warning("Updating node result (run_planned_workflow).")
-        result_object._update_node(db=DispatchDB()._get_data_store(), **node_result)
-        result_webhook.send_update(result_object)
+
+        def _write_node_update():
+            result_object._update_node(db=db, **node_result)
+            result_webhook.send_update(result_object)
+
+        await asyncio.get_running_loop().run_in_executor(_node_writer_pool, _write_node_update)
 
         node_status = node_result["status"]
         if node_status == Result.COMPLETED:
@@ -468,23 +563,25 @@ async def _update_node_result(lock, result_object, node_result, pending_deps, ta
             return
 
         if node_status == Result.FAILED:
-            await _handle_failed_node(result_object, node_result, pending_deps, tasks_queue)
+            await _handle_failed_node(db, result_object, node_result, pending_deps, tasks_queue)
             return
 
         if node_status == Result.CANCELLED:
-            await _handle_cancelled_node(result_object, node_result, pending_deps, tasks_queue)
+            await _handle_cancelled_node(db, result_object, node_result, pending_deps, tasks_queue)
             return
 
         if node_status == Result.RUNNING:
             return
 
 
-async def _run_task_and_update(run_task_callable, lock, result_object, pending_deps, tasks_queue):
+async def _run_task_and_update(
+    run_task_callable, db, lock, result_object, pending_deps, tasks_queue
+):
     node_result = await run_task_callable()
 
     # NOTE: This is a blocking operation because of db writes and needs special handling when
     # we switch to an event loop for processing tasks
-    await _update_node_result(lock, result_object, node_result, pending_deps, tasks_queue)
+    await _update_node_result(db, lock, result_object, node_result, pending_deps, tasks_queue)
     return node_result
 
 
@@ -498,7 +595,7 @@ async def _initialize_deps_and_queue(
     num_tasks = 0
     g = result_object.lattice.transport_graph._graph
     for node_id, d in g.in_degree():
-        app_log.debug(f"Node {node_id} has {d} parents")
+        app_log.debug("Node %s has %s parents", node_id, d)
 
         pending_deps[node_id] = d
         num_tasks += 1
@@ -526,24 +623,31 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
 
     tasks_queue = Queue()
     pending_deps = {}
-    lock = Lock()
+    lock = asyncio.Lock()
     task_futures: list = []
 
     app_log.debug(
         f"4: Workflow status changed to running {result_object.dispatch_id} (run_planned_workflow)."
     )
 
+    # Read the clock once per event; the same instant is reused everywhere
+    # it is recorded.
+    now = datetime.now(timezone.utc)
     result_object._status = Result.RUNNING
-    result_object._start_time = datetime.now(timezone.utc)
+    result_object._start_time = now
+
+    # One DataStore (engine + session factory) for the entire dispatch; a
+    # fresh one per node update would rebuild the engine every time.
+    db = _get_shared_data_store()
 
-    with Session(DispatchDB()._get_data_store().engine) as session:
+    with Session(db.engine) as session:
         session.execute(
             update(Lattice_model)
             .where(Lattice_model.dispatch_id == result_object.dispatch_id)
             .values(
                 status=str(Result.RUNNING),
-                updated_at=datetime.now(timezone.utc),
-                started_at=datetime.now(timezone.utc),
+                updated_at=now,
+                started_at=now,
             )
         )
         session.commit()
@@ -554,62 +658,97 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
     pp_executor_data = result_object.lattice.get_metadata("workflow_executor_data")
     post_processor = [pp_executor, pp_executor_data]
 
-    db = DispatchDB()._get_data_store()
     tasks_left = await _initialize_deps_and_queue(result_object, tasks_queue, pending_deps)
 
+    # Reverse adjacency and edge data are static for the whole run; build
+    # them once instead of re-querying the transport graph per node. The
+    # graph accessors are also bound once here rather than re-resolving
+    # the result_object.lattice.transport_graph chain on every iteration.
+    tg = result_object.lattice.transport_graph
+    get_node_value = tg.get_node_value
+    g = tg._graph
+    parents_of = {node_id: list(g.predecessors(node_id)) for node_id in g.nodes}
+    edge_cache = {(u, v): g.get_edge_data(u, v) for u, v in g.edges()}
+
+    # Flatten each node's input sources once so gathering task inputs is a
+    # plain lookup instead of per-node edge-data iteration.
+    input_plan = {}
+    for plan_node_id in g.nodes:
+        arg_parents = []
+        kwarg_parents = []
+        for parent in parents_of[plan_node_id]:
+            for d in edge_cache[(parent, plan_node_id)].values():
+                if not d.get("wait_for"):
+                    param_type = d.get("param_type")
+                    if param_type == "arg":
+                        arg_parents.append(parent)
+                    elif param_type == "kwarg":
+                        kwarg_parents.append((d["edge_name"], parent))
+        input_plan[plan_node_id] = (arg_parents, kwarg_parents)
+
+    # One executor-template memo per run: nodes sharing an executor config
+    # reuse the template, while the next dispatch re-reads the config.
+    executor_templates = {}
+
     while tasks_left > 0:
-        app_log.debug(f"{tasks_left} tasks left")
+        app_log.debug("%s tasks left", tasks_left)
 
         tasks_left -= 1
         node_id = await tasks_queue.get()
-        app_log.debug(f"Processing node {node_id}")
+        app_log.debug("Processing node %s", node_id)
 
         if node_id < 0:
-            app_log.debug(f"Workflow {result_object.dispatch_id} failed or cancelled.")
-            await asyncio.gather(*task_futures)
+            app_log.debug("Workflow %s failed or cancelled.", result_object.dispatch_id)
+            # Fail fast: the workflow outcome is already decided, so cancel
+            # in-flight tasks instead of letting them run to completion.
+            for fut in task_futures:
+                if not fut.done():
+                    fut.cancel()
+            await asyncio.gather(*task_futures, return_exceptions=True)
             return result_object
 
         # Get name of the node for the current task
-        node_name = result_object.lattice.transport_graph.get_node_value(node_id, "name")
-        app_log.warning(f"7A: Node name: {node_name} (run_planned_workflow).")
+        node_name = get_node_value(node_id, "name")
+        app_log.warning("7A: Node name: %s (run_planned_workflow).", node_name)
 
         # Handle parameter nodes
         if node_name.startswith(parameter_prefix):
             app_log.warning("7C: Parameter if block (run_planned_workflow).")
-            output = result_object.lattice.transport_graph.get_node_value(node_id, "value")
-            app_log.warning(f"7C: Node output: {output} (run_planned_workflow).")
+            output = get_node_value(node_id, "value")
+            app_log.warning("7C: Node output: %s (run_planned_workflow).", output)
             app_log.warning("8: Starting update node (run_planned_workflow).")
 
+            now = datetime.now(timezone.utc)
             node_result = {
                 "node_id": node_id,
-                "start_time": datetime.now(timezone.utc),
-                "end_time": datetime.now(timezone.utc),
+                "start_time": now,
+                "end_time": now,
                 "status": Result.COMPLETED,
                 "output": output,
             }
-            await _update_node_result(lock, result_object, node_result, pending_deps, tasks_queue)
+            await _update_node_result(
+                db, lock, result_object, node_result, pending_deps, tasks_queue
+            )
             app_log.warning("8A: Update node success (run_planned_workflow).")
 
             continue
 
         # Gather inputs and dispatch task
-        app_log.warning(f"Gathering inputs for task {node_id} (run_planned_workflow).")
-        task_input = _get_task_inputs(node_id, node_name, result_object)
-
-        start_time = datetime.now(timezone.utc)
-        serialized_callable = result_object.lattice.transport_graph.get_node_value(
-            node_id, "function"
+        app_log.warning("Gathering inputs for task %s (run_planned_workflow).", node_id)
+        task_input = _get_task_inputs(
+            node_id, node_name, result_object, parents_of, edge_cache, input_plan
         )
 
-        selected_executor = result_object.lattice.transport_graph.get_node_value(
-            node_id, "metadata"
-        )["executor"]
+        start_time = datetime.now(timezone.utc)
+        serialized_callable = get_node_value(node_id, "function")
 
-        selected_executor_data = result_object.lattice.transport_graph.get_node_value(
-            node_id, "metadata"
-        )["executor_data"]
+        # Fetch the node metadata once rather than walking the graph's
+        # attribute store per field
+        node_metadata = get_node_value(node_id, "metadata")
+        selected_executor = node_metadata["executor"]
+        selected_executor_data = node_metadata["executor_data"]
 
-        app_log.debug(f"Collecting deps for task {node_id}")
+        app_log.debug("Collecting deps for task %s", node_id)
         try:
             call_before, call_after = _gather_deps(result_object, node_id)
 
@@ -622,10 +761,10 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
             start_time=start_time,
             status=Result.RUNNING,
         )
-        await _update_node_result(lock, result_object, node_result, pending_deps, tasks_queue)
+        await _update_node_result(db, lock, result_object, node_result, pending_deps, tasks_queue)
         app_log.warning("7: Updating nodes after deps (run_planned_workflow)")
 
-        app_log.debug(f"Submitting task {node_id} to executor")
+        app_log.debug("Submitting task %s to executor", node_id)
 
         run_task_callable = partial(
             _run_task,
@@ -640,12 +779,14 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
             inputs=task_input,
             tasks_pool=thread_pool,
             workflow_executor=post_processor,
+            executor_templates=executor_templates,
         )
 
         # Add the task generated for the node to the list of tasks
         future = asyncio.create_task(
             _run_task_and_update(
                 run_task_callable=run_task_callable,
+                db=db,
                 lock=lock,
                 result_object=result_object,
                 pending_deps=pending_deps,
@@ -664,7 +805,7 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
     app_log.warning("8: All tasks finished running (run_planned_workflow)")
 
     result_object._status = Result.POSTPROCESSING
-    result_object.upsert_lattice_data(DispatchDB()._get_data_store())
+    result_object.upsert_lattice_data(db)
 
     app_log.debug(f"Preparing to post-process workflow {result_object.dispatch_id}")
 
@@ -672,7 +813,7 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
         app_log.debug("Workflow to be postprocessed client side")
         result_object._status = Result.PENDING_POSTPROCESSING
         result_object._end_time = datetime.now(timezone.utc)
-        result_object.upsert_lattice_data(DispatchDB()._get_data_store())
+        result_object.upsert_lattice_data(db)
         result_webhook.send_update(result_object)
         return result_object
 
@@ -680,39 +821,45 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
     post_processing_inputs["args"] = [
         TransportableObject.make_transportable(result_object.lattice),
         TransportableObject.make_transportable(
-            result_object.get_all_node_outputs(DispatchDB()._get_data_store())
+            result_object.get_all_node_outputs(db)
         ),
     ]
     post_processing_inputs["kwargs"] = {}
 
+    # Post-processing re-executes the lattice body and is serialization
+    # heavy; give it a dedicated worker instead of occupying one of the
+    # shared task-pool threads. A process pool would also escape the GIL,
+    # but executor instances are not picklable so they cannot cross a
+    # process boundary here.
     try:
-        future = asyncio.create_task(
-            _run_task(
-                node_id=-1,
-                dispatch_id=result_object.dispatch_id,
-                results_dir=result_object.results_dir,
-                serialized_callable=TransportableObject(_post_process),
-                selected_executor=post_processor,
-                node_name="post_process",
-                call_before=[],
-                call_after=[],
-                inputs=post_processing_inputs,
-                tasks_pool=thread_pool,
-                workflow_executor=post_processor,
+        with ThreadPoolExecutor(max_workers=1) as pp_pool:
+            future = asyncio.create_task(
+                _run_task(
+                    node_id=-1,
+                    dispatch_id=result_object.dispatch_id,
+                    results_dir=result_object.results_dir,
+                    serialized_callable=TransportableObject(_post_process),
+                    selected_executor=post_processor,
+                    node_name="post_process",
+                    call_before=[],
+                    call_after=[],
+                    inputs=post_processing_inputs,
+                    tasks_pool=pp_pool,
+                    workflow_executor=post_processor,
+                )
+            )
+            pp_start_time = datetime.now(timezone.utc)
+            app_log.debug(
+                f"Submitted post-processing job to executor {post_processor} at {pp_start_time}"
             )
-        )
-        pp_start_time = datetime.now(timezone.utc)
-        app_log.debug(
-            f"Submitted post-processing job to executor {post_processor} at {pp_start_time}"
-        )
 
-        post_process_result = await future
+            post_process_result = await future
     except Exception as ex:
         app_log.debug(f"Exception during post-processing: {ex}")
         result_object._status = Result.POSTPROCESSING_FAILED
         result_object._error = "Post-processing failed"
         result_object._end_time = datetime.now(timezone.utc)
-        result_object.upsert_lattice_data(DispatchDB()._get_data_store())
+        result_object.upsert_lattice_data(db)
         result_webhook.send_update(result_object)
 
         return result_object
@@ -725,7 +872,7 @@ async def _run_planned_workflow(result_object: Result, thread_pool: ThreadPoolEx
         result_object._status = Result.POSTPROCESSING_FAILED
         result_object._error = f"Post-processing failed: {err}"
         result_object._end_time = datetime.now(timezone.utc)
-        result_object.upsert_lattice_data(DispatchDB()._get_data_store())
+        result_object.upsert_lattice_data(db)
         result_webhook.send_update(result_object)
 
         return result_object
@@ -809,16 +956,17 @@ def run_workflow(dispatch_id: str, json_lattice: str, tasks_pool: ThreadPoolExec
 
     except Exception as ex:
         app_log.error(f"Exception during _run_planned_workflow: {ex}")
+        now = datetime.now(timezone.utc)
         update_lattices_data(
-            DispatchDB()._get_data_store(),
+            _get_shared_data_store(),
             dispatch_id,
             status=str(Result.FAILED),
-            completed_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            completed_at=now,
+            updated_at=now,
         )
 
         write_lattice_error(
-            DispatchDB()._get_data_store(),
+            _get_shared_data_store(),
             dispatch_id,
             "".join(traceback.TracebackException.from_exception(ex).format()),
         )
@@ -20,89 +20,116 @@
 
 """Dispatch DataBase script."""
 
-import copy
-import json
-import os
-import sqlite3
 from datetime import datetime
-from typing import List, Tuple
+from typing import List
 
-import networkx as nx
-import simplejson
+import orjson
 
-import covalent.executor as covalent_executor
 from covalent._data_store import DataStore
 from covalent._results_manager.result import Result
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.util_classes import Status
-from covalent._shared_files.utils import get_named_params
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
-# DB Schema:
-# TABLE dispatches
-# * dispatch_id text primary key
-# * result_dict text ; json-serialied dictionary representation of Result
+
+# Results are persisted through the normalized DataStore schema (lattice and
+# electron rows referencing pickled payload files); the JSON produced by
+# encode_result is only a view for the UI, not a stored column. The payload
+# files are raw cloudpickle streams read directly by the results manager on
+# the client side as well, so changing their on-disk format (for example,
+# compressing them) is a cross-version compatibility break, not a local
+# storage optimization.
 
 # TODO: Move these to a common utils module
 
 
-def extract_graph_node(node):
-    # avoid mutating original node
-    node = node.copy()
+_UNUSED_NODE_FIELDS = frozenset(("function", "node_name"))
+
+
+def extract_graph_node(node, executor_cache: dict = None):
+    # Build the serializable view directly, leaving the original node
+    # untouched; this replaces the copy-then-pop dance with one dict pass.
+    out = {k: v for k, v in node.items() if k not in _UNUSED_NODE_FIELDS}
 
     # doc string
     f = node.get("function")
     if f is not None:
-        node["doc"] = f.attrs["doc"]
+        out["doc"] = f.attrs["doc"]
 
-    if "value" in node and node["value"] is not None:
-        node["value"] = node["value"].object_string
-    if "output" in node and node["output"] is not None:
-        node["output"] = node["output"].object_string
+    value = out.get("value")
+    if value is not None:
+        out["value"] = value.object_string
+    output = out.get("output")
+    if output is not None:
+        out["output"] = output.object_string
 
     # metadata
-    node["metadata"] = extract_metadata(node["metadata"])
+    out["metadata"] = extract_metadata(out["metadata"], executor_cache)
 
     # prevent JSON encoding
-    node["kwargs"] = encode_dict(node.get("kwargs"))
+    out["kwargs"] = encode_dict(out.get("kwargs"))
 
-    # remove unused fields
-    node.pop("function", None)
-    node.pop("node_name", None)
+    return out
 
-    return node
 
+def _encode_executor_attributes(name: str, cache: dict) -> dict:
+    """Resolve an executor by name and stringify its attributes, memoized.
 
-def extract_metadata(metadata: dict):
+    Every node of a graph typically names the same executor, so the manager
+    lookup and per-attribute str() conversion run once per name rather than
+    once per node. The memo lives in `cache`, which callers scope to a
+    single encode: get_executor re-reads the config file on every call
+    precisely so attribute edits are picked up, and a process-lifetime
+    cache would pin stale attributes in a long-running server.
+    """
+
+    attrs = cache.get(name)
+    if attrs is None:
+        # imported here so merely importing this module doesn't load every
+        # executor plugin
+        import covalent.executor as covalent_executor
+
+        executor = covalent_executor._executor_manager.get_executor(name=name)
+        # Snapshot into a fresh dict (encode_dict may hand back the
+        # executor's own __dict__); within one encode, every node naming
+        # this executor then shares the snapshot by reference. Callers must
+        # treat it as read-only.
+        attrs = dict(encode_dict(executor.__dict__))
+        cache[name] = attrs
+    return attrs
+
+
+def extract_metadata(metadata: dict, executor_cache: dict = None):
     try:
-        # avoid mutating original metadata
-        metadata = copy.deepcopy(metadata)
+        # Build the encoded view in one pass instead of deep-copying the
+        # whole metadata tree and stringifying it in place afterwards; the
+        # rebuilt fields get fresh containers, so the original is untouched.
+        metadata = dict(metadata)
 
         name = metadata["executor"]
         app_log.debug(f"Getting executor {name}")
-        executor = covalent_executor._executor_manager.get_executor(name=name)
 
-        if executor is not None:
-            # extract attributes
-            metadata["executor"] = encode_dict(executor.__dict__)
-            if isinstance(name, str):
-                metadata["executor_name"] = name
-            else:
+        if isinstance(name, str):
+            if executor_cache is None:
+                executor_cache = {}
+            metadata["executor"] = _encode_executor_attributes(name, executor_cache)
+            metadata["executor_name"] = name
+        else:
+            import covalent.executor as covalent_executor
+
+            executor = covalent_executor._executor_manager.get_executor(name=name)
+
+            if executor is not None:
+                # extract attributes
+                metadata["executor"] = encode_dict(executor.__dict__)
                 metadata["executor_name"] = f"<{executor.__class__.__name__}>"
 
         metadata["deps"] = encode_dict(metadata["deps"])
-        call_before = metadata["call_before"]
-        call_after = metadata["call_after"]
-        for i, dep in enumerate(call_before):
-            call_before[i] = str(dep)
 
-        for i, dep in enumerate(call_after):
-            call_after[i] = str(dep)
-
-        metadata["call_before"] = call_before
-        metadata["call_after"] = call_after
+        metadata["call_before"] = [str(dep) for dep in metadata["call_before"]]
+        metadata["call_after"] = [str(dep) for dep in metadata["call_after"]]
 
     except (KeyError, AttributeError) as ex:
         app_log.error(f"Exception when trying to extract metadata: {ex}")
@@ -114,15 +141,36 @@ def encode_dict(d):
     """Avoid JSON encoding when python str() suffices"""
     if not isinstance(d, dict):
         return d
-    return {k: str(v) for (k, v) in d.items()}
-
-
-def extract_graph(graph):
-    graph = nx.json_graph.node_link_data(graph)
-    nodes = list(map(extract_graph_node, graph["nodes"]))
+    # exact type check: str subclasses still need converting
+    if all(type(v) is str for v in d.values()):
+        return d
+    return {k: v if type(v) is str else str(v) for (k, v) in d.items()}
+
+
+def extract_graph(graph, executor_cache: dict = None):
+    # Walk the graph directly rather than letting networkx's node_link_data
+    # materialize an intermediate copy of every node and edge first. The
+    # output shape matches node_link_data's "nodes"/"links" lists.
+    #
+    # The list-of-dicts layout is part of the wire format: the UI's graph
+    # components (Layout.js / LayoutElk.js) index into node objects by key
+    # and have no columnar fallback, so a struct-of-arrays encoding here
+    # would have to ship with a coordinated webapp change.
+    #
+    # Per-node extraction is pure-Python dict and str() work that never
+    # drops the GIL, so fanning it out over a thread pool only adds
+    # scheduling overhead; keep the walk sequential.
+    if executor_cache is None:
+        executor_cache = {}
     return {
-        "nodes": nodes,
-        "links": graph["links"],
+        "nodes": [
+            extract_graph_node({**data, "id": node_id}, executor_cache)
+            for node_id, data in graph.nodes(data=True)
+        ],
+        "links": [
+            {**data, "source": u, "target": v, "key": key}
+            for u, v, key, data in graph.edges(keys=True, data=True)
+        ],
     }
 
 
@@ -137,12 +185,17 @@ def result_encoder(obj):
 def encode_result(result_obj):
     lattice = result_obj.lattice
 
-    result_string = result_obj.encoded_result.json
+    encoded_result = result_obj.encoded_result
+    result_string = encoded_result.json
     if not result_string:
-        result_string = result_obj.encoded_result.object_string
+        result_string = encoded_result.object_string
 
     named_args = {k: v.object_string for k, v in lattice.named_args.items()}
     named_kwargs = {k: v.object_string for k, v in lattice.named_kwargs.items()}
+    # One executor-attrs memo per encode: shared across the lattice metadata
+    # and every graph node, discarded afterwards so config edits show up in
+    # the next encode.
+    executor_cache = {}
     result_dict = {
         "dispatch_id": result_obj.dispatch_id,
         "status": result_obj.status,
@@ -156,12 +209,16 @@ def encode_result(result_obj):
             "doc": lattice.__doc__,
             "name": lattice.__name__,
             "inputs": encode_dict({**named_args, **named_kwargs}),
-            "metadata": extract_metadata(lattice.metadata),
+            "metadata": extract_metadata(lattice.metadata, executor_cache),
         },
-        "graph": extract_graph(result_obj.lattice.transport_graph._graph),
+        "graph": extract_graph(result_obj.lattice.transport_graph._graph, executor_cache),
     }
 
-    jsonified_result = simplejson.dumps(result_dict, default=result_encoder, ignore_nan=True)
+    # orjson's C encoder is several times faster than simplejson here and
+    # already emits null for NaN/Infinity, matching ignore_nan=True. Native
+    # types (including datetimes) are handled directly; anything else, such
+    # as Status, falls through to result_encoder.
+    jsonified_result = orjson.dumps(result_dict, default=result_encoder).decode()
 
     return jsonified_result
 
@@ -176,6 +233,7 @@ class DispatchDB:
             self._dbpath = dbpath
         else:
             self._dbpath = get_config("user_interface.dispatch_db")
+        self._datastore = None
 
     def __enter__(self):
         return self
@@ -184,9 +242,17 @@ class DispatchDB:
         return False
 
     def _get_data_store(self, initialize_db: bool = False) -> DataStore:
-        """Return the DataStore instance to write records."""
+        """Return the DataStore instance to write records.
+
+        The store (and with it the SQLAlchemy engine and connection pool)
+        is built once per DispatchDB handle and reused by later calls.
+        """
 
-        return DataStore(db_URL=f"sqlite+pysqlite:///{self._dbpath}", initialize_db=initialize_db)
+        if self._datastore is None:
+            self._datastore = DataStore(
+                db_URL=f"sqlite+pysqlite:///{self._dbpath}", initialize_db=initialize_db
+            )
+        return self._datastore
 
     def save_db(
         self, result_object: Result, write_source: bool = False, initialize_db: bool = False
@@ -204,3 +270,19 @@ class DispatchDB:
         except Exception as e:
             app_log.exception(f"Exception occured while saving to DB: {e}.")
             raise
+
+    def save_many(self, result_objects: List[Result], initialize_db: bool = False) -> None:
+        """Persist several result objects back to back.
+
+        All of them go through the cached DataStore, so rapid successive
+        saves share one engine and its WAL-tuned connection pool instead of
+        paying per-save engine setup.
+        """
+
+        ds = self._get_data_store(initialize_db)
+        try:
+            for result_object in result_objects:
+                result_object.persist(ds)
+        except Exception as e:
+            app_log.exception(f"Exception occured while saving to DB: {e}.")
+            raise
@@ -28,7 +28,7 @@ from logging import Logger
 from logging.handlers import DEFAULT_TCP_LOGGING_PORT
 from pathlib import Path
 
-import simplejson
+import orjson
 import tailer
 from flask import Flask, jsonify, make_response, request, send_from_directory
 from flask_cors import CORS
@@ -79,7 +79,7 @@ def list_results():
     if not res:
         return jsonify([])
     else:
-        return jsonify([simplejson.loads(r[1]) for r in res])
+        return jsonify([orjson.loads(r[1]) for r in res])
 
 
 @app.route("/api/dev/results/<dispatch_id>")
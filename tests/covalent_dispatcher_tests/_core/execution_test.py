@@ -25,7 +25,6 @@ Tests for the core functionality of the dispatcher.
 
 import asyncio
 from asyncio import Queue
-from threading import Lock
 from typing import Dict, List
 
 import cloudpickle as pickle
@@ -314,6 +313,63 @@ def test_get_task_inputs():
     )
 
 
+def test_get_task_inputs_with_input_plan():
+    """Test that the precomputed input_plan branch of _get_task_inputs matches
+    the legacy per-node edge iteration, including positional-arg ordering"""
+
+    @ct.electron
+    def combine(a, b, c=None, d=None):
+        return (a, b, c, d)
+
+    @ct.lattice
+    def workflow(a, b, c, d):
+        return combine(a, b, c=c, d=d)
+
+    workflow.build_graph(1, 2, c=3, d=4)
+    tg = workflow.transport_graph
+    g = tg._graph
+
+    # Node 0 is the task; give each parameter node a distinct output
+    for node_id in g.nodes:
+        if node_id != 0:
+            tg.set_node_value(node_id, "output", ct.TransportableObject(node_id))
+
+    # Build the plan the same way _run_planned_workflow does
+    parents_of = {node_id: list(g.predecessors(node_id)) for node_id in g.nodes}
+    edge_cache = {(u, v): g.get_edge_data(u, v) for u, v in g.edges()}
+    input_plan = {}
+    for node_id in g.nodes:
+        arg_parents = []
+        kwarg_parents = []
+        for parent in parents_of[node_id]:
+            for d in edge_cache[(parent, node_id)].values():
+                if not d.get("wait_for"):
+                    param_type = d.get("param_type")
+                    if param_type == "arg":
+                        arg_parents.append(parent)
+                    elif param_type == "kwarg":
+                        kwarg_parents.append((d["edge_name"], parent))
+        input_plan[node_id] = (arg_parents, kwarg_parents)
+
+    result_object = Result(lattice=workflow, results_dir="/tmp", dispatch_id="asdf")
+    node_name = tg.get_node_value(0, "name")
+
+    planned_inputs = _get_task_inputs(
+        0, node_name, result_object, parents_of, edge_cache, input_plan
+    )
+    legacy_inputs = _get_task_inputs(0, node_name, result_object)
+
+    assert planned_inputs["args"] == legacy_inputs["args"]
+    assert planned_inputs["kwargs"] == legacy_inputs["kwargs"]
+
+    # Positional args arrive in call order; kwargs keep their edge names
+    assert [t.get_deserialized() for t in planned_inputs["args"]] == [1, 2]
+    assert {k: t.get_deserialized() for k, t in planned_inputs["kwargs"].items()} == {
+        "c": 3,
+        "d": 4,
+    }
+
+
 def test_gather_deps():
     """Test internal _gather_deps for assembling deps into call_before and
     call_after"""
@@ -384,7 +440,7 @@ async def test_run_task(mocker, sublattice_workflow):
 async def test_update_failed_node(mocker):
     """Check that update_node_result correctly invokes _handle_failed_node"""
 
-    lock = Lock()
+    lock = asyncio.Lock()
     tasks_queue = Queue()
     pending_deps = {}
 
@@ -395,11 +451,12 @@ async def test_update_failed_node(mocker):
     )
     mock_update_node = mocker.patch("covalent._results_manager.result.Result._update_node")
 
+    db = mocker.MagicMock()
     node_result = {"node_id": 0, "status": Result.FAILED}
-    await _update_node_result(lock, result_object, node_result, pending_deps, tasks_queue)
+    await _update_node_result(db, lock, result_object, node_result, pending_deps, tasks_queue)
 
     mock_fail_handler.assert_called_once_with(
-        result_object, node_result, pending_deps, tasks_queue
+        db, result_object, node_result, pending_deps, tasks_queue
     )
 
 
@@ -407,7 +464,7 @@ async def test_update_failed_node(mocker):
 async def test_update_cancelled_node(mocker):
     """Check that update_node_result correctly invokes _handle_cancelled_node"""
 
-    lock = Lock()
+    lock = asyncio.Lock()
     tasks_queue = Queue()
     pending_deps = {}
 
@@ -420,11 +477,12 @@ async def test_update_cancelled_node(mocker):
     )
     mock_update_node = mocker.patch("covalent._results_manager.result.Result._update_node")
 
+    db = mocker.MagicMock()
     node_result = {"node_id": 0, "status": Result.CANCELLED}
-    await _update_node_result(lock, result_object, node_result, pending_deps, tasks_queue)
+    await _update_node_result(db, lock, result_object, node_result, pending_deps, tasks_queue)
 
     mock_cancel_handler.assert_called_once_with(
-        result_object, node_result, pending_deps, tasks_queue
+        db, result_object, node_result, pending_deps, tasks_queue
     )
 
 
@@ -432,7 +490,7 @@ async def test_update_cancelled_node(mocker):
 async def test_update_completed_node(mocker):
     """Check that update_node_result correctly invokes _handle_completed_node"""
 
-    lock = Lock()
+    lock = asyncio.Lock()
     tasks_queue = Queue()
     pending_deps = {}
 
@@ -445,8 +503,9 @@ async def test_update_completed_node(mocker):
     )
     mock_update_node = mocker.patch("covalent._results_manager.result.Result._update_node")
 
+    db = mocker.MagicMock()
     node_result = {"node_id": 0, "status": Result.COMPLETED}
-    await _update_node_result(lock, result_object, node_result, pending_deps, tasks_queue)
+    await _update_node_result(db, lock, result_object, node_result, pending_deps, tasks_queue)
 
     mock_completed_handler.assert_called_once_with(
         result_object, node_result, pending_deps, tasks_queue
@@ -500,7 +559,7 @@ async def test_handle_failed_node(mocker):
 
     node_result = {"node_id": 1, "status": Result.FAILED}
 
-    await _handle_failed_node(result_object, node_result, pending_deps, tasks_queue)
+    await _handle_failed_node(mocker.MagicMock(), result_object, node_result, pending_deps, tasks_queue)
 
     assert await asyncio.wait_for(tasks_queue.get(), timeout=1) == -1
     assert pending_deps == {0: 1, 1: 0, 2: 1}
@@ -528,7 +587,7 @@ async def test_handle_cancelled_node(mocker):
 
     node_result = {"node_id": 1, "status": Result.CANCELLED}
 
-    await _handle_cancelled_node(result_object, node_result, pending_deps, tasks_queue)
+    await _handle_cancelled_node(mocker.MagicMock(), result_object, node_result, pending_deps, tasks_queue)
 
     assert await asyncio.wait_for(tasks_queue.get(), timeout=1) == -1
     assert pending_deps == {0: 1, 1: 0, 2: 1}
@@ -51,3 +51,14 @@ def test_save_db(mocker):
         persist_mock = mocker.patch("covalent._results_manager.result.Result.persist")
         db.save_db(result_object=res)
         persist_mock.assert_called_once()
+
+
+def test_save_many(mocker):
+    """Test persisting several results through one data store."""
+
+    with DispatchDB(":memory:") as db:
+        res_1 = Result(check, "/home/test/results", "asdf")
+        res_2 = Result(check, "/home/test/results", "fdsa")
+        persist_mock = mocker.patch("covalent._results_manager.result.Result.persist")
+        db.save_many([res_1, res_2])
+        assert persist_mock.call_count == 2
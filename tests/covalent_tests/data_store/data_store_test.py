@@ -31,3 +31,34 @@ def test_datastore_init():
 
     ds = DataStore(db_URL=None)
     assert ds.db_URL == "sqlite+pysqlite:///" + get_config("user_interface.dispatch_db")
+
+
+def test_sqlite_pragmas(tmp_path):
+    """Test that file-backed SQLite connections are switched to WAL mode."""
+
+    db_path = tmp_path / "my_db.sqlite"
+    ds = DataStore(db_URL=f"sqlite+pysqlite:///{db_path}", initialize_db=True)
+
+    with ds.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
+
+def test_begin_session_batches_file_operations(mocker):
+    """Test that queued uploads and deletes are flushed one batch per backend."""
+
+    backend = mocker.MagicMock()
+    ds = DataStore(
+        db_URL="sqlite+pysqlite:///:memory:",
+        storage_backend_map={"local": backend},
+        initialize_db=True,
+    )
+
+    data_1, data_2 = mocker.MagicMock(), mocker.MagicMock()
+    with ds.begin_session() as session:
+        session.queue_upload(data_1, "local", "bucket", "file_1.pkl")
+        session.queue_upload(data_2, "local", "bucket", "file_2.pkl")
+        session.queue_delete("local", "bucket", "file_3.pkl")
+
+    assert backend.put.call_count == 2
+    backend.delete.assert_called_once_with("bucket", ["file_3.pkl"])
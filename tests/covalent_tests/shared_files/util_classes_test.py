@@ -0,0 +1,48 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Unit tests for the shared utility classes."""
+
+from covalent._shared_files.util_classes import Timer, _flush_timer_queue, load_timer_report
+
+
+def test_timer_appends_jsonl_records(tmp_path, mocker):
+    """Test that each timer stop appends one record to the report file."""
+
+    mocker.patch(
+        "covalent._shared_files.util_classes.get_config",
+        return_value=str(tmp_path),
+    )
+
+    timer = Timer("endpoint", "test operation", Timer.DISPATCHER, dispatch_id="dispatch_1")
+    timer.start()
+    timer.stop()
+    timer.start()
+    timer.stop()
+    _flush_timer_queue()
+
+    report_file = tmp_path / "timer_report.jsonl"
+    assert len(report_file.read_text().splitlines()) == 2
+
+    report = load_timer_report(str(report_file))
+    assert len(report["dispatch_1"]) == 2
+    for record in report["dispatch_1"].values():
+        assert record["service"] == Timer.DISPATCHER
+        assert record["elapsed_time"] >= 0